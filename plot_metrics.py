@@ -11,115 +11,487 @@ from __future__ import annotations
 
 import argparse
 import csv
-import statistics
+import importlib.util
+import os
+import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 
-import matplotlib
+import numpy as np
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import pandas as pd
 
+# pyarrow y pandas son opcionales y se importan solo en el lector que los usa,
+# de modo que --help y las salidas por error no pagan su importación.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+# numba solo se usa si faltan ambos; sus funciones viven en plot_metrics_numba.
+_HAS_NUMBA = importlib.util.find_spec("numba") is not None
 
-VALID_MODES = {"especulativo", "secuencial"}
 
+# Nombres canónicos internados: las claves por modo se comparan por identidad.
+ESPECULATIVO = sys.intern("especulativo")
+SECUENCIAL = sys.intern("secuencial")
+VALID_MODES: FrozenSet[str] = frozenset({ESPECULATIVO, SECUENCIAL})
+# Formatos numéricos aceptados por el lector pyarrow, equivalentes a
+# int()/float(): signo opcional, "_" entre dígitos, inf/infinity/nan.
+_DIGITS = r"\d(?:_?\d)*"
+_INT_PATTERN = rf"^[+-]?{_DIGITS}$"
+_FLOAT_PATTERN = (
+    rf"^[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+    r"|(?i:inf|infinity|nan))$"
+)
+# Columnas del CSV que se usan para graficar.
+_COLUMNS = ["mode", "run", "total_duration_ms"]
+# Filas por bloque al leer con pandas.
+_CHUNK_SIZE = 1_000_000
+# Los tiempos en ms caben en float32; se usa la mitad de memoria que con float64.
+_DURATION_DTYPE = np.float32
 
-def load_totals(path: Path) -> Tuple[Dict[str, List[float]], Dict[str, List[int]]]:
-    """Carga los tiempos totales por modo desde el CSV."""
+
+def _has_columns(path: Path) -> bool:
+    """Indica si el encabezado del CSV tiene todas las columnas de _COLUMNS."""
+    with path.open(newline="", encoding="utf-8") as handle:
+        header = next(csv.reader(handle), [])
+    return set(_COLUMNS).issubset(header)
+
+
+def _load_totals_csv(path: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, List[int]]]:
+    """Lee el CSV fila a fila con csv.DictReader (sin dependencias extra)."""
     per_mode: Dict[str, Dict[int, float]] = defaultdict(dict)
+    # main.go escribe las corridas en orden creciente; solo se ordena si no es así.
+    last_run: Dict[str, int] = {}
+    needs_sort: Set[str] = set()
 
     with path.open(newline="", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
         for row in reader:
-            mode = row.get("mode", "").strip().lower()
+            # Las filas cortas dejan None en las columnas faltantes.
+            mode = (row.get("mode") or "").strip().lower()
             if mode not in VALID_MODES:
                 # Evita filas de resumen o vacías.
                 continue
-            run_str = row.get("run", "").strip()
+            # Reutiliza la cadena canónica en lugar de una copia por fila.
+            mode = sys.intern(mode)
+            run_str = (row.get("run") or "").strip()
             try:
                 run_index = int(run_str)
             except ValueError:
                 continue
-            value = row.get("total_duration_ms", "").strip()
+            value = (row.get("total_duration_ms") or "").strip()
             if not value:
                 continue
             try:
                 per_mode[mode].setdefault(run_index, float(value))
             except ValueError:
                 continue
+            if run_index < last_run.get(mode, run_index):
+                needs_sort.add(mode)
+            last_run[mode] = run_index
 
-    durations: Dict[str, List[float]] = {}
+    durations: Dict[str, np.ndarray] = {}
     run_indices: Dict[str, List[int]] = {}
     for mode, runs in per_mode.items():
-        sorted_runs = sorted(runs.keys())
+        if mode in needs_sort:
+            sorted_runs = sorted(runs.keys())
+            values = [runs[idx] for idx in sorted_runs]
+        else:
+            # Los dict conservan el orden de inserción, que ya es creciente.
+            sorted_runs = list(runs.keys())
+            values = list(runs.values())
         run_indices[mode] = sorted_runs
-        durations[mode] = [runs[idx] for idx in sorted_runs]
+        durations[mode] = np.asarray(values, dtype=_DURATION_DTYPE)
     return durations, run_indices
 
 
-def build_figure(
-    data: Dict[str, List[float]], run_indices: Dict[str, List[int]], title: str
-) -> plt.Figure:
-    """Devuelve una figura con barras de promedios, líneas por corrida y speedup."""
-    has_both_modes = {"especulativo", "secuencial"}.issubset(data.keys())
-    num_axes = 3 if has_both_modes else 2
-    figure, axes = plt.subplots(1, num_axes, figsize=(5 * num_axes, 4))
-    if num_axes == 1:
-        axes = [axes]
+def _to_numbers(text: np.ndarray, convert: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Convierte un arreglo de textos a números; devuelve (valores, máscara de válidos).
+
+    pd.to_numeric clasifica en C casi todas las celdas. Solo las que rechaza (o,
+    para las corridas, un bloque con "1.0" o "1e0") se revisan con ``convert``,
+    que es int o float, para aceptar exactamente lo mismo que el lector csv.
+    """
+    import pandas as pd
+
+    parsed = pd.to_numeric(text, errors="coerce")
+    if convert is int:
+        if parsed.dtype == np.int64:
+            # Todas las celdas eran enteros sin punto ni exponente.
+            return parsed, np.ones(len(text), dtype=bool)
+        values = np.zeros(len(text), dtype=np.int64)
+        doubtful = np.ones(len(text), dtype=bool)
+        if parsed.dtype.kind == "f":
+            # Se reintenta sin las celdas rechazadas (NaN): si el resto son
+            # enteros, solo esas celdas quedan por revisar.
+            accepted = ~np.isnan(parsed)
+            integers = pd.to_numeric(text[accepted], errors="coerce")
+            if integers.dtype == np.int64:
+                values[accepted] = integers
+                doubtful = ~accepted
     else:
-        axes = list(axes)
+        values = np.zeros(len(text), dtype=np.float64)
+        doubtful = np.isnan(parsed) if parsed.dtype.kind == "f" else np.zeros(len(text), bool)
+        # to_numeric puede diferir de float() en el último bit; astype usa float().
+        values[~doubtful] = text[~doubtful].astype(np.float64)
+
+    valid = ~doubtful
+    for pos in np.flatnonzero(doubtful):
+        cell = text[pos]
+        if not isinstance(cell, str):
+            continue
+        try:
+            values[pos] = convert(cell)
+        except ValueError:
+            continue
+        valid[pos] = True
+    return values, valid
+
+
+def _valid_rows_pandas(
+    chunk: pd.DataFrame, names: Sequence[str]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Devuelve (índice de modo en ``names``, corrida, duración) de las filas válidas."""
+    # El modo se lee como categoría: se normaliza cada valor distinto una sola vez
+    # y las filas se traducen con sus códigos, sin operaciones de texto por fila.
+    modes = chunk["mode"].cat
+    lookup = np.full(len(modes.categories) + 1, -1, dtype=np.int64)
+    for code, category in enumerate(modes.categories):
+        mode = category.strip().lower()
+        if mode in VALID_MODES:
+            lookup[code] = names.index(mode)
+    # El código -1 (celda faltante) cae en el último elemento, que vale -1.
+    mode_idx = lookup[modes.codes.to_numpy()]
+    # Las filas de resumen o con otro modo se descartan antes de convertir.
+    keep = mode_idx >= 0
+    runs, valid_runs = _to_numbers(chunk["run"].to_numpy(dtype=object)[keep], int)
+    values, valid_values = _to_numbers(
+        chunk["total_duration_ms"].to_numpy(dtype=object)[keep], float
+    )
+    valid = valid_runs & valid_values
+    return mode_idx[keep][valid], runs[valid], values[valid]
+
+
+def _load_totals_pandas(path: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, List[int]]]:
+    """Lee el CSV con pandas por bloques.
+
+    Solo se guardan las corridas distintas de cada modo: la memoria crece con
+    ellas y con el tamaño del bloque, no con el número de filas del archivo.
+    """
+    import pandas as pd
+
+    if not _has_columns(path):
+        return {}, {}
+    reader = pd.read_csv(
+        path,
+        usecols=_COLUMNS,
+        # Números como texto: la fila de resumen no es numérica y el mismo bloque
+        # debe convertirse igual que con int()/float(). Sin na_filter, "NaN"
+        # llega como texto y se interpreta igual que float().
+        dtype={"mode": "category", "run": object, "total_duration_ms": object},
+        na_filter=False,
+        chunksize=_CHUNK_SIZE,
+    )
+    names = sorted(VALID_MODES)
+    # Corridas ya vistas por modo, ordenadas, con la duración de su primera fila.
+    seen_runs = [np.empty(0, dtype=np.int64) for _ in names]
+    seen_values = [np.empty(0, dtype=_DURATION_DTYPE) for _ in names]
+    try:
+        with reader:
+            for chunk in reader:
+                mode_idx, runs, values = _valid_rows_pandas(chunk, names)
+                for idx in range(len(names)):
+                    selected = mode_idx == idx
+                    chunk_runs, chunk_values = _first_per_run(runs[selected], values[selected])
+                    # Una corrida que ya apareció en un bloque anterior conserva esa fila.
+                    new = ~np.isin(chunk_runs, seen_runs[idx], assume_unique=True)
+                    merged_runs = np.concatenate((seen_runs[idx], chunk_runs[new]))
+                    merged_values = np.concatenate(
+                        (seen_values[idx], chunk_values[new].astype(_DURATION_DTYPE))
+                    )
+                    order = np.argsort(merged_runs, kind="stable")
+                    seen_runs[idx] = merged_runs[order]
+                    seen_values[idx] = merged_values[order]
+    except OverflowError:
+        # Números de corrida fuera del rango de int64: se usa el lector tolerante.
+        return _load_totals_csv(path)
+
+    durations: Dict[str, np.ndarray] = {}
+    run_indices: Dict[str, List[int]] = {}
+    for mode, mode_runs, mode_values in zip(names, seen_runs, seen_values):
+        if mode_runs.size:
+            run_indices[mode] = mode_runs.tolist()
+            durations[mode] = mode_values
+    return durations, run_indices
+
+
+def _first_per_run(runs: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Ordena por corrida y conserva la primera fila del archivo para cada una."""
+    order = np.argsort(runs, kind="stable")
+    # Con orden estable, np.unique devuelve la primera fila de cada corrida.
+    unique_runs, first = np.unique(runs[order], return_index=True)
+    return unique_runs, values[order][first]
+
+
+def _split_by_mode(
+    names: Sequence[str], mode_idx: np.ndarray, runs: np.ndarray, values: np.ndarray
+) -> Tuple[Dict[str, np.ndarray], Dict[str, List[int]]]:
+    """Separa las filas válidas por modo a partir de su índice en ``names``."""
+    durations: Dict[str, np.ndarray] = {}
+    run_indices: Dict[str, List[int]] = {}
+    for idx, mode in enumerate(names):
+        selected = mode_idx == idx
+        if not selected.any():
+            continue
+        unique_runs, mode_values = _first_per_run(runs[selected], values[selected])
+        run_indices[mode] = unique_runs.tolist()
+        durations[mode] = mode_values.astype(_DURATION_DTYPE, copy=False)
+    return durations, run_indices
+
+
+def _load_totals_arrow(path: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, List[int]]]:
+    """Lee el CSV con el lector multihilo de pyarrow, sin pasar por pandas."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+
+    if not _has_columns(path):
+        return {}, {}
+    skipped_rows = []
+
+    def skip_row(row: Any) -> str:
+        skipped_rows.append(row.number)
+        return "skip"
+
+    table = pacsv.read_csv(
+        path,
+        parse_options=pacsv.ParseOptions(invalid_row_handler=skip_row),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=_COLUMNS,
+            # Todo como texto: la fila de resumen no es numérica.
+            column_types={name: pa.string() for name in _COLUMNS},
+        ),
+    )
+    if skipped_rows:
+        # Filas con más o menos columnas que el encabezado: csv.DictReader las
+        # interpreta igual que siempre, así que se delega en el lector tolerante.
+        return _load_totals_csv(path)
+    names = sorted(VALID_MODES)
+    # Normalización y validación en una sola máscara, sin bucles en Python.
+    mode_col = pc.index_in(
+        pc.utf8_lower(pc.utf8_trim_whitespace(table["mode"])), value_set=pa.array(names)
+    )
+    run_col = pc.utf8_trim_whitespace(table["run"])
+    value_col = pc.utf8_trim_whitespace(table["total_duration_ms"])
+    mask = pc.and_(
+        pc.is_valid(mode_col),
+        pc.and_(
+            pc.match_substring_regex(run_col, _INT_PATTERN),
+            pc.match_substring_regex(value_col, _FLOAT_PATTERN),
+        ),
+    )
+    mode_idx = mode_col.filter(mask).to_numpy()
+    try:
+        # Arrow no acepta el signo "+" ni "_" al convertir enteros, a diferencia de int().
+        runs = pc.replace_substring_regex(run_col.filter(mask), r"^\+|_", "")
+        runs = runs.cast(pa.int64()).to_numpy()
+        values = pc.replace_substring(value_col.filter(mask), "_", "")
+        values = values.cast(pa.float32()).to_numpy()
+    except (pa.ArrowInvalid, ValueError):
+        # Un valor que pasó las expresiones regulares pero Arrow no convierte:
+        # se delega en el lector tolerante en lugar de fallar.
+        return _load_totals_csv(path)
+    return _split_by_mode(names, mode_idx, runs, values)
+
+
+def _load_totals_numba(path: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, List[int]]]:
+    """Lee el CSV con un analizador de bytes compilado con numba."""
+    from plot_metrics_numba import scan_rows
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        header = next(csv.reader(handle), [])
+    if not set(_COLUMNS).issubset(header):
+        return {}, {}
+    columns = np.array([header.index(name) for name in _COLUMNS], dtype=np.int64)
+    raw = path.read_bytes()
+    header_end = raw.find(b"\n")
+    header_end = len(raw) if header_end < 0 else header_end
+
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    names = sorted(VALID_MODES)
+    # Nombres de modo como matriz de bytes (una fila por modo) para la función compilada.
+    mode_lengths = np.array([len(name) for name in names], dtype=np.int64)
+    mode_names = np.zeros((len(names), int(mode_lengths.max())), dtype=np.uint8)
+    for idx, name in enumerate(names):
+        mode_names[idx, : len(name)] = np.frombuffer(name.encode("ascii"), dtype=np.uint8)
+    capacity = raw.count(b"\n") + 1
+    mode_idx, runs, values, overflow = scan_rows(
+        buf, header_end + 1, columns, mode_names, mode_lengths, capacity
+    )
+    if overflow:
+        # Números fuera del rango de int64: se usa el lector tolerante.
+        return _load_totals_csv(path)
+    return _split_by_mode(names, mode_idx, runs, values)
+
+
+def load_totals(path: Path) -> Tuple[Dict[str, np.ndarray], Dict[str, List[int]]]:
+    """Carga los tiempos totales por modo desde el CSV."""
+    if _HAS_PYARROW:
+        return _load_totals_arrow(path)
+    if _HAS_PANDAS:
+        return _load_totals_pandas(path)
+    if _HAS_NUMBA:
+        return _load_totals_numba(path)
+    return _load_totals_csv(path)
+
+
+# Figuras ya construidas, indexadas por (número de ejes, modos presentes).
+_CACHE: Dict[Tuple[int, Tuple[str, ...]], Tuple[plt.Figure, Dict[str, Any]]] = {}
+
+
+def _import_pyplot():
+    """Importa pyplot solo cuando se va a dibujar (--help y errores no lo pagan)."""
+    import matplotlib
+
+    # Backend no interactivo por defecto; MPLBACKEND permite sobrescribirlo.
+    if "MPLBACKEND" not in os.environ:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def _init_figure(modes: Sequence[str], num_axes: int) -> Tuple[plt.Figure, Dict[str, Any]]:
+    """Crea la figura y los artistas vacíos que luego actualiza _update_figure."""
+    plt = _import_pyplot()
+    figure, axes = plt.subplots(
+        1, num_axes, figsize=(5 * num_axes, 4), constrained_layout=True
+    )
+    axes = list(axes)
 
     # Subgráfico de barras con promedios.
     ax_bar = axes[0]
-    labels = []
-    averages = []
-    for mode in sorted(data.keys()):
-        labels.append(mode.capitalize())
-        averages.append(statistics.mean(data[mode]))
-    ax_bar.bar(labels, averages, color=["steelblue", "darkorange"])
+    bars = ax_bar.bar(
+        [mode.capitalize() for mode in modes],
+        [0.0] * len(modes),
+        color=["steelblue", "darkorange"],
+    )
     ax_bar.set_ylabel("Tiempo promedio (ms)")
     ax_bar.set_title("Promedio por estrategia")
 
     # Subgráfico de líneas para observar la evolución por corrida.
     ax_line = axes[1]
-    for mode in sorted(data.keys()):
-        runs = list(range(1, len(data[mode]) + 1))
-        ax_line.plot(runs, data[mode], marker="o", label=mode.capitalize())
+    lines = {}
+    for mode in modes:
+        (lines[mode],) = ax_line.plot([], [], marker="o", label=mode.capitalize())
     ax_line.set_xlabel("Corrida")
     ax_line.set_ylabel("Tiempo total (ms)")
     ax_line.set_title("Evolución por corrida")
     ax_line.legend()
 
-    if has_both_modes:
+    handles: Dict[str, Any] = {
+        "ax_bar": ax_bar,
+        "bars": bars,
+        "ax_line": ax_line,
+        "lines": lines,
+        "ax_speedup": None,
+        "speedup_line": None,
+    }
+    if num_axes == 3:
         ax_speedup = axes[2]
-        spec_runs = run_indices.get("especulativo", [])
-        seq_runs = run_indices.get("secuencial", [])
-        spec_map = dict(zip(spec_runs, data.get("especulativo", [])))
-        seq_map = dict(zip(seq_runs, data.get("secuencial", [])))
-        common_runs = sorted(set(spec_map).intersection(seq_map))
-        speedup_values: List[float] = []
-        for run in common_runs:
-            speculative = spec_map[run]
-            sequential = seq_map[run]
-            if speculative == 0:
-                speedup_values.append(float("nan"))
-            else:
-                speedup_values.append(sequential / speculative)
-        if speedup_values:
-            ax_speedup.plot(common_runs, speedup_values, marker="o", color="seagreen")
-            ax_speedup.axhline(1.0, color="gray", linestyle="--", linewidth=1)
-            ax_speedup.set_xlabel("Corrida")
-            ax_speedup.set_ylabel("Speedup (TpO secuencial / TpO especulativo)")
-            ax_speedup.set_title("Speedup por corrida")
-        else:
-            ax_speedup.set_visible(False)
+        (handles["speedup_line"],) = ax_speedup.plot([], [], marker="o", color="seagreen")
+        ax_speedup.axhline(1.0, color="gray", linestyle="--", linewidth=1)
+        ax_speedup.set_xlabel("Corrida")
+        ax_speedup.set_ylabel("Speedup (TpO secuencial / TpO especulativo)")
+        ax_speedup.set_title("Speedup por corrida")
+        handles["ax_speedup"] = ax_speedup
+    return figure, handles
+
+
+def _update_figure(
+    figure: plt.Figure,
+    handles: Dict[str, Any],
+    data: Dict[str, np.ndarray],
+    run_indices: Dict[str, List[int]],
+    title: str,
+) -> None:
+    """Carga los datos en los artistas de una figura creada por _init_figure."""
+    modes = list(handles["lines"])
+
+    for bar, mode in zip(handles["bars"], modes):
+        bar.set_height(float(data[mode].mean(dtype=np.float64)))
+    handles["ax_bar"].relim()
+    handles["ax_bar"].autoscale_view()
+
+    for mode in modes:
+        runs = np.arange(1, len(data[mode]) + 1)
+        handles["lines"][mode].set_data(runs, data[mode])
+    handles["ax_line"].relim()
+    handles["ax_line"].autoscale_view()
+
+    ax_speedup = handles["ax_speedup"]
+    if ax_speedup is not None:
+        # load_totals entrega corridas únicas y ordenadas, por eso assume_unique.
+        common_runs, spec_pos, seq_pos = np.intersect1d(
+            np.asarray(run_indices[ESPECULATIVO]),
+            np.asarray(run_indices[SECUENCIAL]),
+            assume_unique=True,
+            return_indices=True,
+        )
+        spec_arr = data[ESPECULATIVO][spec_pos]
+        seq_arr = data[SECUENCIAL][seq_pos]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            speedup = np.where(spec_arr == 0, np.nan, seq_arr / spec_arr)
+        handles["speedup_line"].set_data(common_runs, speedup)
+        ax_speedup.relim()
+        ax_speedup.autoscale_view()
+        ax_speedup.set_visible(speedup.size > 0)
 
     figure.suptitle(title)
-    figure.tight_layout()
+
+
+def _layout(data: Dict[str, np.ndarray]) -> Tuple[int, Tuple[str, ...]]:
+    """Devuelve (número de ejes, modos presentes) para los datos a graficar."""
+    modes = tuple(sorted(data.keys()))
+    num_axes = 3 if VALID_MODES.issubset(modes) else 2
+    return num_axes, modes
+
+
+def build_figure(
+    data: Dict[str, np.ndarray], run_indices: Dict[str, List[int]], title: str
+) -> plt.Figure:
+    """Devuelve una figura con barras de promedios, líneas por corrida y speedup."""
+    num_axes, modes = _layout(data)
+    figure, handles = _init_figure(modes, num_axes)
+    _update_figure(figure, handles, data, run_indices, title)
     return figure
 
 
+def render(
+    data: Dict[str, np.ndarray],
+    run_indices: Dict[str, List[int]],
+    title: str,
+    output: Path,
+    dpi: int = 100,
+    fmt: Optional[str] = None,
+) -> None:
+    """Dibuja los datos y los guarda en ``output``.
+
+    La figura se reutiliza entre llamadas con los mismos modos, de modo que
+    regenerar la gráfica solo actualiza los datos de los artistas existentes.
+    Si ``fmt`` es None, el formato se deduce de la extensión de ``output``.
+    """
+    key = _layout(data)
+    if key not in _CACHE:
+        _CACHE[key] = _init_figure(key[1], key[0])
+    figure, handles = _CACHE[key]
+    _update_figure(figure, handles, data, run_indices, title)
+    figure.savefig(output, dpi=dpi, format=fmt)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Genera gráficas comparativas a partir del CSV de métricas."
@@ -129,26 +501,109 @@ def parse_args() -> argparse.Namespace:
         "output",
         type=Path,
         nargs="?",
-        default=Path("comparacion_estrategias.png"),
-        help="Ruta del archivo de imagen a generar (PNG).",
+        default=None,
+        help=(
+            "Ruta del archivo de imagen a generar (PNG, SVG o PDF). Por defecto: "
+            "comparacion_estrategias con la extensión de --format (png si no se indica)."
+        ),
     )
     parser.add_argument(
         "--title",
         default="Comparación ejecución especulativa vs secuencial",
         help="Título principal de la figura.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=100,
+        help=(
+            "Resolución de la imagen (por defecto: 100). El tiempo de guardado en PNG "
+            "crece con el cuadrado del DPI; en SVG/PDF casi no influye."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=["png", "svg", "pdf"],
+        default=None,
+        help=(
+            "Formato de salida (por defecto: según la extensión de OUTPUT). Debe coincidir "
+            "con esa extensión si se indican ambos. SVG y PDF "
+            "son vectoriales: no se rasterizan y suelen ser más livianos para estas gráficas."
+        ),
+    )
+    parser.add_argument(
+        "--batch",
+        nargs="+",
+        type=Path,
+        default=[],
+        metavar="CSV",
+        help=(
+            "CSV adicionales a graficar en paralelo (un proceso por archivo). Cada figura "
+            "se guarda junto a su CSV, con la extensión de --format (png por defecto)."
+        ),
+    )
+    args = parser.parse_args()
+    if args.output is None:
+        args.output = Path(f"comparacion_estrategias.{args.format or 'png'}")
+    elif args.format and args.output.suffix and args.output.suffix.lower() != f".{args.format}":
+        # Evita, por ejemplo, guardar un SVG en un archivo .png.
+        parser.error(f"la extensión de {args.output} no coincide con --format {args.format}")
+    return args
+
+
+def _render_one(
+    csv_path: Path, output: Path, title: str, dpi: int, fmt: Optional[str]
+) -> Optional[Path]:
+    """Carga un CSV y guarda su figura; devuelve None si no hay datos válidos."""
+    durations, run_indices = load_totals(csv_path)
+    if not durations:
+        return None
+    render(durations, run_indices, title=title, output=output, dpi=dpi, fmt=fmt)
+    return output
 
 
 def main() -> None:
     args = parse_args()
-    durations, run_indices = load_totals(args.csv_path)
-    if not durations:
-        raise SystemExit("No se encontraron datos válidos en el CSV.")
+    if not args.batch:
+        output = _render_one(args.csv_path, args.output, args.title, args.dpi, args.format)
+        if output is None:
+            raise SystemExit("No se encontraron datos válidos en el CSV.")
+        print(f"Gráfica generada en: {output}")
+        return
+
+    # Cada CSV se procesa en su propio proceso (backend Agg, figura independiente).
+    csv_paths = [args.csv_path, *args.batch]
+    outputs = [args.output]
+    outputs += [path.with_suffix(f".{args.format or 'png'}") for path in args.batch]
+    missing: List[Path] = []
+    errors: List[str] = []
+    with ProcessPoolExecutor(max_workers=min(len(csv_paths), os.cpu_count() or 1)) as executor:
+        futures = {
+            executor.submit(_render_one, path, output, args.title, args.dpi, args.format): path
+            for path, output in zip(csv_paths, outputs)
+        }
+        # Un CSV que falla no impide informar las figuras que sí se generaron.
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                output = future.result()
+            except Exception as exc:
+                errors.append(f"{path}: {exc}")
+                continue
+            if output is None:
+                missing.append(path)
+            else:
+                print(f"Gráfica generada en: {output}")
 
-    figure = build_figure(durations, run_indices, title=args.title)
-    figure.savefig(args.output, dpi=150, bbox_inches="tight")
-    print(f"Gráfica generada en: {args.output}")
+    problems = []
+    if missing:
+        problems.append(
+            "No se encontraron datos válidos en: " + ", ".join(str(path) for path in missing)
+        )
+    if errors:
+        problems.append("Error al procesar " + "; ".join(errors))
+    if problems:
+        raise SystemExit("\n".join(problems))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,201 @@
+"""
+Funciones compiladas con numba para leer el CSV de métricas sin pandas ni pyarrow.
+
+plot_metrics.py importa este módulo solo cuando ese es el lector elegido, así
+el costo de importar numba no se paga en el resto de los casos.
+"""
+
+import numpy as np
+from numba import njit
+
+# Resultado de _parse_int/_parse_float.
+_INVALID = 0
+_VALID = 1
+# El número no cabe en int64: quien llama debe usar el lector tolerante.
+_OVERFLOW = 2
+# Con hasta 18 dígitos el valor siempre cabe en int64.
+_MAX_INT_DIGITS = 18
+
+# Palabras especiales que float() acepta, en minúsculas.
+_NAN = np.frombuffer(b"nan", dtype=np.uint8)
+_INF = np.frombuffer(b"inf", dtype=np.uint8)
+_INFINITY = np.frombuffer(b"infinity", dtype=np.uint8)
+
+
+@njit(cache=True)
+def _strip_blanks(buf, start, end):
+    """Recorta espacios, tabulaciones y retornos de carro de buf[start:end]."""
+    while start < end and (buf[start] == 32 or buf[start] == 9 or buf[start] == 13):
+        start += 1
+    while end > start and (buf[end - 1] == 32 or buf[end - 1] == 9 or buf[end - 1] == 13):
+        end -= 1
+    return start, end
+
+
+@njit(cache=True)
+def _field_bounds(buf, start, end):
+    """Quita las comillas externas de buf[start:end] y recorta espacios, como csv + strip()."""
+    if start < end and buf[start] == 34:
+        # csv solo reconoce el campo entre comillas si la comilla va primero.
+        start, end = _strip_blanks(buf, start + 1, end)
+        if end > start and buf[end - 1] == 34:
+            end -= 1
+    return _strip_blanks(buf, start, end)
+
+
+@njit(cache=True)
+def _match_word(buf, start, end, word, length):
+    """Compara buf[start:end] con word[:length] sin distinguir mayúsculas ASCII."""
+    if end - start != length:
+        return False
+    for offset in range(length):
+        char = buf[start + offset]
+        if 65 <= char <= 90:
+            char += 32
+        if char != word[offset]:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _digits_end(buf, pos, end):
+    """Avanza sobre dígitos con "_" simples entre ellos; devuelve (fin, cantidad)."""
+    count = 0
+    while pos < end:
+        char = buf[pos]
+        if 48 <= char <= 57:
+            count += 1
+            pos += 1
+        elif char == 95 and count > 0 and pos + 1 < end and 48 <= buf[pos + 1] <= 57:
+            pos += 1
+        else:
+            break
+    return pos, count
+
+
+@njit(cache=True)
+def _accumulate(buf, start, end, value):
+    """Agrega a ``value`` los dígitos de buf[start:end], ignorando los "_"."""
+    for pos in range(start, end):
+        if buf[pos] != 95:
+            value = value * 10.0 + (buf[pos] - 48)
+    return value
+
+
+@njit(cache=True)
+def _parse_int(buf, start, end):
+    """Convierte buf[start:end] a entero como int(); devuelve (valor, estado)."""
+    negative = False
+    if start < end and (buf[start] == 43 or buf[start] == 45):
+        negative = buf[start] == 45
+        start += 1
+    stop, count = _digits_end(buf, start, end)
+    if count == 0 or stop != end:
+        return 0, _INVALID
+    if count > _MAX_INT_DIGITS:
+        return 0, _OVERFLOW
+    value = 0
+    for pos in range(start, end):
+        if buf[pos] != 95:
+            value = value * 10 + (buf[pos] - 48)
+    return (-value if negative else value), _VALID
+
+
+@njit(cache=True)
+def _parse_float(buf, start, end):
+    """Convierte buf[start:end] a float como float(); devuelve (valor, estado)."""
+    negative = False
+    if start < end and (buf[start] == 43 or buf[start] == 45):
+        negative = buf[start] == 45
+        start += 1
+    if _match_word(buf, start, end, _NAN, 3):
+        return np.nan, _VALID
+    if _match_word(buf, start, end, _INF, 3) or _match_word(buf, start, end, _INFINITY, 8):
+        return (-np.inf if negative else np.inf), _VALID
+
+    pos, digits = _digits_end(buf, start, end)
+    mantissa = _accumulate(buf, start, pos, 0.0)
+    scale = 0
+    if pos < end and buf[pos] == 46:
+        stop, decimals = _digits_end(buf, pos + 1, end)
+        mantissa = _accumulate(buf, pos + 1, stop, mantissa)
+        digits += decimals
+        scale -= decimals
+        pos = stop
+    if digits == 0:
+        return 0.0, _INVALID
+    if pos < end and (buf[pos] == 101 or buf[pos] == 69):
+        exponent, status = _parse_int(buf, pos + 1, end)
+        if status != _VALID:
+            return 0.0, status
+        scale += exponent
+        pos = end
+    if pos != end:
+        return 0.0, _INVALID
+    value = mantissa * 10.0**scale if scale >= 0 else mantissa / 10.0 ** (-scale)
+    return (-value if negative else value), _VALID
+
+
+@njit(cache=True)
+def scan_rows(buf, start, columns, mode_names, mode_lengths, capacity):
+    """Recorre las líneas del CSV y extrae (modo, corrida, duración) válidos.
+
+    ``columns`` tiene las posiciones de mode, run y total_duration_ms; el modo
+    se devuelve como índice de fila dentro de ``mode_names``. El último valor
+    indica si algún número no cabía en int64 (los resultados no son completos).
+    """
+    mode_idx = np.empty(capacity, np.int64)
+    runs = np.empty(capacity, np.int64)
+    values = np.empty(capacity, np.float64)
+    bounds = np.empty(6, np.int64)
+    count = 0
+    overflow = False
+    pos = start
+    size = buf.size
+    while pos < size:
+        bounds[:] = -1
+        field = 0
+        field_start = pos
+        in_quotes = False
+        while True:
+            at_end = pos >= size
+            char = 10 if at_end else buf[pos]
+            if char == 34:
+                in_quotes = not in_quotes
+            elif at_end or (not in_quotes and (char == 44 or char == 10)):
+                for target in range(3):
+                    if columns[target] == field:
+                        bounds[2 * target] = field_start
+                        bounds[2 * target + 1] = pos
+                field += 1
+                field_start = pos + 1
+                if char == 10:
+                    pos += 1
+                    break
+            pos += 1
+
+        if bounds[1] < 0 or bounds[3] < 0 or bounds[5] < 0:
+            continue
+        mode_start, mode_end = _field_bounds(buf, bounds[0], bounds[1])
+        found = -1
+        for idx in range(mode_names.shape[0]):
+            if _match_word(buf, mode_start, mode_end, mode_names[idx], mode_lengths[idx]):
+                found = idx
+                break
+        if found < 0:
+            # Evita filas de resumen o vacías.
+            continue
+        run_start, run_end = _field_bounds(buf, bounds[2], bounds[3])
+        run_index, run_status = _parse_int(buf, run_start, run_end)
+        value_start, value_end = _field_bounds(buf, bounds[4], bounds[5])
+        value, value_status = _parse_float(buf, value_start, value_end)
+        if run_status == _OVERFLOW or value_status == _OVERFLOW:
+            overflow = True
+            continue
+        if run_status != _VALID or value_status != _VALID:
+            continue
+        mode_idx[count] = found
+        runs[count] = run_index
+        values[count] = value
+        count += 1
+    return mode_idx[:count], runs[:count], values[:count], overflow
@@ -0,0 +1,114 @@
+"""
+Verifica que todos los lectores de plot_metrics.py entreguen lo mismo que
+el lector de referencia basado en csv.DictReader.
+
+    python -m pytest test_plot_metrics.py
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import plot_metrics
+
+REPO_CSV = Path(__file__).with_name("metricas_caseA.csv")
+
+# Filas completas: los lectores rápidos las procesan sin recurrir al respaldo.
+REGULAR_ROWS = [
+    "mode,run,branch,total_duration_ms,error",
+    "especulativo,2,A,21.5,",
+    "especulativo,2,B,99,",
+    "especulativo,1,A,20.25,",
+    " Secuencial ,+3,A,30,",
+    "SECUENCIAL,1_0,A,1_000.5,",
+    "secuencial,1,A,inf,",
+    "secuencial,2,A,NaN,",
+    "secuencial,4,A,-Infinity,",
+    "secuencial,5,A,1e3,",
+    "secuencial,6,A,.5,",
+    "secuencial,7,A,5.,",
+    "secuencial,3000000000,A,7.125,",
+    "secuencial,1.0,A,7,",
+    "secuencial,1e0,A,7,",
+    "secuencial,8,A,,",
+    "secuencial,9,A,abc,",
+    "secuencial,11,A,1__0,",
+    "secuencial,16,A,0x10,",
+    'especulativo,3,"x, ""quoted""",12.5,"err, with comma"',
+    '" secuencial ",12,A," 2.5 ",',
+    'secuencial," 13 ",A,"3.5",',
+    "otro,1,A,1,",
+    "",
+    "resumen,,,avg_speculative_ms=1;speedup=2,",
+]
+
+# Filas cortas o largas y corridas fuera de int64: fuerzan el lector tolerante.
+IRREGULAR_ROWS = [
+    "mode,run,branch,total_duration_ms,error",
+    "secuencial,2,A,4.5,",
+    "secuencial",
+    "foo",
+    "especulativo,1,A,3.25,extra,fields",
+    "especulativo,2,A,3.5",
+    "especulativo,99999999999999999999,A,1,",
+    "secuencial,1,A,4.25,",
+]
+
+
+def _load_totals_pandas_python(path: Path):
+    # Sin pyarrow, pandas guarda el texto como objetos de Python.
+    import pandas as pd
+
+    with pd.option_context("mode.string_storage", "python"):
+        return plot_metrics._load_totals_pandas(path)
+
+
+LOADERS = {
+    "arrow": ("pyarrow", plot_metrics._load_totals_arrow),
+    "pandas": ("pandas", plot_metrics._load_totals_pandas),
+    "pandas-python": ("pandas", _load_totals_pandas_python),
+    "numba": ("numba", plot_metrics._load_totals_numba),
+}
+
+
+def _write_csv(tmp_path: Path, name: str, rows: list) -> Path:
+    path = tmp_path / name
+    # CRLF, como lo escribiría una herramienta en Windows.
+    path.write_bytes("\r\n".join(rows).encode("utf-8") + b"\r\n")
+    return path
+
+
+@pytest.fixture(params=["repo", "regular", "irregular"])
+def csv_path(request, tmp_path):
+    if request.param == "repo":
+        return REPO_CSV
+    if request.param == "regular":
+        return _write_csv(tmp_path, "regular.csv", REGULAR_ROWS)
+    return _write_csv(tmp_path, "irregular.csv", IRREGULAR_ROWS)
+
+
+@pytest.mark.parametrize("loader_name", sorted(LOADERS))
+def test_loaders_match_csv_reader(loader_name, csv_path):
+    module, loader = LOADERS[loader_name]
+    pytest.importorskip(module)
+
+    expected_durations, expected_runs = plot_metrics._load_totals_csv(csv_path)
+    durations, run_indices = loader(csv_path)
+
+    assert expected_durations
+    assert run_indices == expected_runs
+    assert durations.keys() == expected_durations.keys()
+    for mode, expected in expected_durations.items():
+        assert durations[mode].dtype == expected.dtype
+        np.testing.assert_array_equal(durations[mode], expected)
+
+
+@pytest.mark.parametrize("loader_name", sorted(LOADERS))
+def test_loaders_without_required_columns(loader_name, tmp_path):
+    module, loader = LOADERS[loader_name]
+    pytest.importorskip(module)
+
+    path = _write_csv(tmp_path, "sin_columnas.csv", ["mode,run,other", "secuencial,1,5"])
+    assert loader(path) == ({}, {})
+    assert plot_metrics._load_totals_csv(path) == ({}, {})